@@ -3,15 +3,30 @@ import time
 import threading
 import platform
 import subprocess
-import io
-import wave
 import struct
+import array
+import sys
 import math
+import re
 import tempfile
 import os
+import collections
 import tkinter as tk
 from tkinter import ttk
-from math import isfinite
+from functools import partial
+
+# NumPy is optional; click synthesis falls back to pure Python without it.
+try:
+    import numpy as np  # optional
+except Exception:
+    np = None
+
+# sounddevice (with NumPy) lets System mode keep one output stream open
+# instead of spawning a player process for every tick.
+try:
+    import sounddevice as sd  # optional
+except Exception:
+    sd = None
 
 # Try to import simpleaudio but DO NOT use it unless user selects it.
 try:
@@ -25,45 +40,132 @@ APP_MIN_HEIGHT = 760
 SR = 44100  # sample rate
 BYTES_PER_SAMPLE = 2
 NUM_CH = 1
-
-def clamp_bpm(value):
-    try:
-        v = float(value)
-    except (ValueError, TypeError):
+UPDATE_DEBOUNCE_MS = 30  # coalesce bursts of slider/entry events
+CLOCK_POLL_MS = 10  # how often the GUI drains ticks from the audio clock
+METRO_SPIN_S = 0.002  # busy-wait tail before each tick deadline
+CLICK_CACHE_VERSION = 1  # bump when synth_click_pcm output changes
+CLICK_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "bpmcalc")
+
+# (name, beats, beats label) rows of the note durations table
+NOTES = tuple((name, beats, f"{beats:g}") for name, beats in (
+    ("1 bar (4/4)", 4.0),
+    ("Dotted half", 3.0),
+    ("Half", 2.0),
+    ("Dotted quarter", 1.5),
+    ("Quarter", 1.0),
+    ("Triplet quarter", 2.0/3.0),
+    ("Eighth", 0.5),
+    ("Triplet eighth", 1.0/3.0),
+    ("Sixteenth", 0.25),
+    ("Triplet sixteenth", 1.0/6.0),
+    ("Thirty-second", 0.125),
+))
+
+# 60000 * beats for each NOTES row: its duration in ms is this / bpm
+NOTE_MS_AT_1_BPM = tuple(60000.0 * beats for _, beats, _ in NOTES)
+
+BPM_TEXT_MATCH = re.compile(r"\d*\.?\d*").fullmatch
+
+RELATED_BPM_FORMAT = ("Half-time BPM: {:.2f}      Double-time BPM: {:.2f}\n"
+                      "Third-time BPM (÷3): {:.2f}      Quad-time BPM (×4): {:.2f}")
+RELATED_BPM_ZERO = RELATED_BPM_FORMAT.format(0.0, 0.0, 0.0, 0.0)
+
+# Metronome subdivision -> ticks per beat
+SUBDIVISIONS = {
+    "Quarter": 1.0,
+    "Eighth": 2.0,
+    "Sixteenth": 4.0,
+    "Quarter Triplets": 1.5,
+}
+
+def clamp_bpm(v):
+    # v is already a float (DoubleVar.get() returns one); NaN counts as 0.
+    if not v >= 0:
         return 0.0
-    if v < 0:
-        v = 0.0
     if v > 500:
-        v = 500.0
+        return 500.0
     return v
 
+def bpm_table(bpm):
+    # Pure arithmetic behind the calculator, usable without the GUI (e.g. to
+    # tabulate many tempos): ms per beat, Hz, half/double/third/quad-time BPM,
+    # then one duration in ms per NOTES row. Durations are inf at 0 BPM.
+    if bpm > 0:
+        return (60000.0 / bpm, bpm / 60.0, bpm / 2, bpm * 2, bpm / 3, bpm * 4,
+                *(k / bpm for k in NOTE_MS_AT_1_BPM))
+    return (float("inf"), bpm / 60.0, bpm / 2, bpm * 2, bpm / 3, bpm * 4) + (float("inf"),) * len(NOTES)
+
 # ---------- Click synthesis ----------
 def synth_click_pcm(f_hz=2000.0, ms=20, gain=0.3, samplerate=SR):
     n = int(samplerate * (ms / 1000.0))
-    buf = bytearray()
-    for i in range(n):
-        t = i / samplerate
-        env = math.exp(-t * 60)  # very fast decay
-        sample = math.sin(2 * math.pi * f_hz * t) * env * gain
-        if sample > 1.0: sample = 1.0
-        if sample < -1.0: sample = -1.0
-        s = int(sample * 32767.0)
-        buf += struct.pack('<h', s)
-    return bytes(buf)
+    if np is not None:
+        t = np.arange(n, dtype=np.float64) / samplerate
+        env = np.exp(-t * 60.0)  # very fast decay
+        s = np.sin(2 * np.pi * f_hz * t) * env * gain
+        np.clip(s, -1.0, 1.0, out=s)
+        return (s * 32767.0).astype('<i2').tobytes()
+
+    # Two-term sine recurrence y[i+1] = 2cos(w)y[i] - y[i-1] and a multiplicative
+    # envelope: no sin/exp call per sample.
+    w = 2.0 * math.pi * f_hz / samplerate
+    c = 2.0 * math.cos(w)
+    y, y_prev = 0.0, -math.sin(w)  # sin(0), sin(-w)
+    env, env_step = gain * 32767.0, math.exp(-60.0 / samplerate)
+    samples = []
+    for _ in range(n):
+        s = int(y * env)
+        samples.append(-32767 if s < -32767 else 32767 if s > 32767 else s)
+        y, y_prev = c * y - y_prev, y
+        env *= env_step
+    pcm = array.array('h', samples)
+    if sys.byteorder != 'little':
+        pcm.byteswap()
+    return pcm.tobytes()
 
 def wrap_wav(pcm_bytes, samplerate=SR, num_ch=NUM_CH, bytes_per_sample=BYTES_PER_SAMPLE):
-    with io.BytesIO() as bio:
-        with wave.open(bio, 'wb') as wf:
-            wf.setnchannels(num_ch)
-            wf.setsampwidth(bytes_per_sample)
-            wf.setframerate(samplerate)
-            wf.writeframes(pcm_bytes)
-        return bio.getvalue()
-
-ACCENT_PCM = synth_click_pcm(f_hz=2200.0, ms=25, gain=0.5)
-TICK_PCM   = synth_click_pcm(f_hz=1500.0, ms=20, gain=0.35)
+    # Canonical 44-byte PCM RIFF header, packed in one call.
+    data_size = len(pcm_bytes)
+    block_align = num_ch * bytes_per_sample
+    header = struct.pack('<4sI4s4sIHHIIHH4sI',
+                         b'RIFF', 36 + data_size, b'WAVE',
+                         b'fmt ', 16, 1, num_ch, samplerate, samplerate * block_align, block_align, 8 * bytes_per_sample,
+                         b'data', data_size)
+    return header + pcm_bytes
+
+def cached_click_pcm(name, f_hz=2000.0, ms=20, gain=0.3, samplerate=SR):
+    # Clicks never change at runtime, so reuse the PCM from a previous launch.
+    # The header encodes every parameter; any change invalidates the file.
+    header = f"bpmcalc-click v{CLICK_CACHE_VERSION} {f_hz!r} {ms!r} {gain!r} {samplerate!r}\n".encode("ascii")
+    path = os.path.join(CLICK_CACHE_DIR, name + ".pcm")
+    expected = int(samplerate * (ms / 1000.0)) * BYTES_PER_SAMPLE
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data.startswith(header) and len(data) - len(header) == expected:
+            return data[len(header):]
+    except OSError:
+        pass
+
+    pcm = synth_click_pcm(f_hz=f_hz, ms=ms, gain=gain, samplerate=samplerate)
+    try:
+        os.makedirs(CLICK_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(header + pcm)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return pcm
+
+ACCENT_PCM = cached_click_pcm("accent", f_hz=2200.0, ms=25, gain=0.5)
+TICK_PCM   = cached_click_pcm("tick",   f_hz=1500.0, ms=20, gain=0.35)
 ACCENT_WAV = wrap_wav(ACCENT_PCM)
 TICK_WAV   = wrap_wav(TICK_PCM)
+# Zero-copy int16 sample views for stream mixing, shared by every AudioEngine
+ACCENT_NP = np.frombuffer(ACCENT_PCM, dtype='<i2') if np is not None else None
+TICK_NP   = np.frombuffer(TICK_PCM,   dtype='<i2') if np is not None else None
+STREAM_BLOCKSIZE = 256  # frames per sounddevice callback (~5.8 ms at 44.1 kHz)
+MAX_OUTPUT_LATENCY_S = 0.5  # larger DAC-time offsets are treated as bogus
 
 class AudioEngine:
     def __init__(self, mode='System'):
@@ -76,6 +178,18 @@ class AudioEngine:
         self._sa_tick = None
         self._tmp_accent = None
         self._tmp_tick = None
+        self._stream = None
+        # Callback-stream state: frame counter and clicks still sounding as
+        # [samples, start frame]
+        self._frame = 0
+        self._voices = []
+        # Sample clock: tick cache dict while running, next tick frame (None = next block)
+        self._clock_settings = None
+        self._clock_next = None
+        self._clock_count = 0
+        # Ticks the clock placed, as (accent, beat, perf_counter time heard);
+        # drained by the GUI thread, since the audio callback must never call Tk.
+        self.ticks = collections.deque()
 
         if self.mode == 'SimpleAudio' and sa is not None:
             try:
@@ -86,17 +200,131 @@ class AudioEngine:
                 self.mode = 'System'
 
         if self.mode == 'System':
+            if sd is not None and np is not None:
+                try:
+                    # Opened here but only started while needed: the callback
+                    # would otherwise run every block for the life of the app.
+                    self._stream = sd.OutputStream(samplerate=SR, channels=NUM_CH, dtype='int16', blocksize=STREAM_BLOCKSIZE,
+                                                   latency='low', callback=self._audio_callback)
+                    self._mix = np.zeros(STREAM_BLOCKSIZE, dtype=np.int32)
+                except Exception as e:
+                    print("[AudioEngine] Failed to open sounddevice stream, using system player:", e)
+                    self._stream = None
+            if self._stream is None:
+                self._write_temp_wavs()
+
+    def start_clock(self, settings):
+        # Run the metronome inside the stream callback, placing clicks by sample
+        # index. `settings` is the metronome's tick cache, re-read every block;
+        # ticks are reported through self.ticks while visuals are on.
+        # False if there is no callback stream.
+        if not self._start_stream():
+            return False
+        self.ticks.clear()
+        self._clock_count = 0
+        self._clock_next = None
+        self._clock_settings = settings
+        return True
+
+    def stop_clock(self):
+        self._clock_settings = None
+        if self._stream is not None and self._stream.active:
             try:
-                ta = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                ta.write(ACCENT_WAV); ta.flush(); ta.close()
-                self._tmp_accent = ta.name
-                tt = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                tt.write(TICK_WAV); tt.flush(); tt.close()
-                self._tmp_tick = tt.name
+                self._stream.stop()
             except Exception as e:
-                print("[AudioEngine] Failed to create temp wavs:", e)
+                print("[AudioEngine] Failed to stop sounddevice stream:", e)
+
+    def _start_stream(self):
+        if self._stream is None:
+            return False
+        if not self._stream.active:
+            self._voices = []
+            try:
+                self._latency = min(max(0.0, self._stream.latency), MAX_OUTPUT_LATENCY_S)
+                self._stream.start()
+            except Exception as e:
+                print("[AudioEngine] Failed to start sounddevice stream, using system player:", e)
+                self._close_stream()
+                if not self._tmp_accent:
+                    self._write_temp_wavs()
+                return False
+        return True
+
+    def _audio_callback(self, outdata, frames, time_info, status):
+        start = self._frame
+        end = start + frames
+
+        settings = self._clock_settings
+        if settings is not None:
+            bpm = settings["bpm"]
+            if bpm <= 0:
+                self._clock_next = None  # restart on the first block with a BPM again
+            else:
+                if self._clock_next is None:
+                    self._clock_next = start
+                period = SR * 60.0 / (bpm * settings["subdiv"])
+                # Not every host API fills these timestamps; fall back to the
+                # stream's nominal latency when the difference is implausible.
+                latency = time_info.outputBufferDacTime - time_info.currentTime
+                if not 0.0 <= latency <= MAX_OUTPUT_LATENCY_S:
+                    latency = self._latency
+                heard = time.perf_counter() + latency
+                while self._clock_next < end:
+                    at = int(self._clock_next)
+                    beat = self._clock_count % settings["accent_every"]
+                    if settings["audio_on"]:
+                        self._voices.append([ACCENT_NP if beat == 0 else TICK_NP, at])
+                    if settings["visual_on"]:
+                        self.ticks.append((beat == 0, beat, heard + (at - start) / SR))
+                    self._clock_count = (self._clock_count + 1) % 1000000
+                    self._clock_next += period
+
+        if frames > len(self._mix):
+            self._mix = np.zeros(frames, dtype=np.int32)
+        mix = self._mix[:frames]
+        mix.fill(0)
+        voices = []
+        for samples, at in self._voices:
+            src = max(0, start - at)
+            dst = max(0, at - start)
+            n = min(len(samples) - src, frames - dst)
+            if n > 0:
+                mix[dst:dst + n] += samples[src:src + n]
+            if at + len(samples) > end:
+                voices.append([samples, at])
+        self._voices = voices
+        np.clip(mix, -32768, 32767, out=mix)
+        outdata[:] = mix.reshape(-1, 1)
+        self._frame = end
+
+    def _write_temp_wavs(self):
+        try:
+            self._tmp_accent = self._write_temp_wav(ACCENT_WAV)
+            self._tmp_tick = self._write_temp_wav(TICK_WAV)
+        except Exception as e:
+            print("[AudioEngine] Failed to create temp wavs:", e)
+
+    @staticmethod
+    def _write_temp_wav(data):
+        # One unbuffered write of the prebuilt WAV; mkstemp creates the file 0600.
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return path
+
+    def _close_stream(self):
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
 
     def cleanup(self):
+        self._close_stream()
         for p in (self._tmp_accent, self._tmp_tick):
             if p and os.path.exists(p):
                 try:
@@ -113,7 +341,11 @@ class AudioEngine:
                 print("[AudioEngine] SimpleAudio play failed; switching to System:", e)
                 self.mode = 'System'
 
-        # System mode
+        # System mode. The callback stream only sounds clicks through
+        # start_clock(), so one-off clicks always go to the system player.
+        if self.system != 'Windows' and not self._tmp_accent:
+            self._write_temp_wavs()
+
         if self.system == 'Darwin':
             path = self._tmp_accent if accent else self._tmp_tick
             if path:
@@ -164,10 +396,8 @@ class BpmCalculator(tk.Tk):
         self.bpm_var = tk.DoubleVar(value=120.0)
         self.ms_per_beat_var = tk.StringVar(value="500.00 ms")
         self.hz_var = tk.StringVar(value="2.000 Hz")
-        self.half_bpm_var = tk.StringVar(value="60.00")
-        self.double_bpm_var = tk.StringVar(value="240.00")
-        self.third_bpm_var = tk.StringVar(value="40.00")
-        self.quad_bpm_var = tk.StringVar(value="480.00")
+        # Half/double/third/quad-time BPM share one label: one Tcl write per update
+        self.related_bpm_var = tk.StringVar(value="")
 
         self.tap_bpm_var = tk.StringVar(value="—")
         self.tap_count_var = tk.StringVar(value="0")
@@ -177,6 +407,30 @@ class BpmCalculator(tk.Tk):
         self.swing_first_ms_var = tk.StringVar(value="—")
         self.swing_second_ms_var = tk.StringVar(value="—")
 
+        # Last bpm_var value (and raw text) that passed the entry check. Kept by
+        # a trace so hot paths skip Tcl; a rejected edit restores the text.
+        self._last_good_bpm = self.bpm_var.get()
+        self._last_good_text = str(self.getvar(str(self.bpm_var)))
+
+        # Plain-Python mirror of the settings the metronome reads every tick,
+        # kept fresh by variable traces so the loop never calls into Tcl.
+        self._tick_readers = {
+            "bpm": lambda: clamp_bpm(self._last_good_bpm),
+            "subdiv": self._subdiv_multiplier,
+            "accent_every": lambda: max(1, int(self.metro_accent_every_var.get())),
+            "audio_on": self.audio_enabled_var.get,
+            "visual_on": self.visual_enabled_var.get,
+        }
+        self._tick_cache = {}
+        self._refresh_tick_cache()
+
+        self._pending_update = None
+        self._clock_poll = None
+        self._last_update_key = None
+        self._syncing_scale = False
+        self._shown_text = {}
+        self._zero_state_shown = False
+
         self._build_ui()
         self._wire_events()
         self.update_calculations()
@@ -190,8 +444,7 @@ class BpmCalculator(tk.Tk):
         input_frame.pack(fill="x", pady=(0, 12))
 
         ttk.Label(input_frame, text="BPM (0–500):").grid(row=0, column=0, padx=(12, 8), pady=12, sticky="w")
-        vcmd = (self.register(self._validate_bpm_entry), "%P")
-        self.bpm_entry = ttk.Entry(input_frame, textvariable=self.bpm_var, width=10, validate="key", validatecommand=vcmd)
+        self.bpm_entry = ttk.Entry(input_frame, textvariable=self.bpm_var, width=10)
         self.bpm_entry.grid(row=0, column=1, pady=12, sticky="w")
 
         # Scale for BPM
@@ -204,7 +457,7 @@ class BpmCalculator(tk.Tk):
         quick = ttk.Frame(input_frame)
         quick.grid(row=0, column=3, sticky="e", padx=(8, 12))
         for val in (60, 90, 100, 120, 140, 160):
-            ttk.Button(quick, text=str(val), width=4, command=lambda v=val: self.set_bpm(v)).pack(side="left", padx=2)
+            ttk.Button(quick, text=str(val), width=4, command=partial(self.set_bpm, val)).pack(side="left", padx=2)
 
         # === Tap-tempo & Swing row ===
         ts = ttk.LabelFrame(main, text="Tap Tempo & Swing")
@@ -247,7 +500,7 @@ class BpmCalculator(tk.Tk):
 
         ttk.Label(metro, text="Subdivision:").grid(row=0, column=1, sticky="e")
         self.metro_subdiv = ttk.Combobox(metro, textvariable=self.metro_subdiv_var, width=16, state="readonly",
-                                         values=["Quarter", "Eighth", "Sixteenth", "Quarter Triplets"])
+                                         values=list(SUBDIVISIONS))
         self.metro_subdiv.grid(row=0, column=2, padx=8, sticky="w")
 
         ttk.Label(metro, text="Accent every").grid(row=0, column=3, sticky="e")
@@ -283,15 +536,8 @@ class BpmCalculator(tk.Tk):
         ttk.Label(summary, text="Frequency (Hz):").grid(row=0, column=2, padx=(24, 8), pady=8, sticky="w")
         ttk.Label(summary, textvariable=self.hz_var, font=("", 10, "bold")).grid(row=0, column=3, pady=8, sticky="w")
 
-        grid = [
-            ("Half-time BPM", self.half_bpm_var),
-            ("Double-time BPM", self.double_bpm_var),
-            ("Third-time BPM (÷3)", self.third_bpm_var),
-            ("Quad-time BPM (×4)", self.quad_bpm_var),
-        ]
-        for i, (label, var) in enumerate(grid, start=1):
-            ttk.Label(summary, text=label + ":").grid(row=i, column=0 if i < 3 else 2, padx=12 if i < 3 else (24, 8), pady=4, sticky="w")
-            ttk.Label(summary, textvariable=var, font=("", 10, "bold")).grid(row=i, column=1 if i < 3 else 3, pady=4, sticky="w")
+        ttk.Label(summary, textvariable=self.related_bpm_var, font=("", 10, "bold"), justify="left").grid(
+            row=1, column=0, columnspan=4, padx=12, pady=(0, 8), sticky="w")
 
         # === Note durations table ===
         table_frame = ttk.LabelFrame(main, text="Note Durations (based on current BPM)")
@@ -307,6 +553,12 @@ class BpmCalculator(tk.Tk):
         self.tree.column("millis", width=160, anchor="e")
         self.tree.pack(fill="both", expand=True, padx=8, pady=8)
 
+        # Rows are inserted once; update_calculations only rewrites their values.
+        self._note_rows = [self.tree.insert("", "end", values=(name, beats_str, "")) for name, _, beats_str in NOTES]
+        self.tree.insert("", "end", values=("— Swung Eighths (pair) —", "", ""))
+        self._swing_first_row = self.tree.insert("", "end", values=("   First 8th", "—", "—"))
+        self._swing_second_row = self.tree.insert("", "end", values=("   Second 8th", "—", "—"))
+
         hint = ttk.Label(main, text="Safe Mode audio by default. Switch to 'SimpleAudio' if desired. Visual indicator flashes on each tick.", foreground="#666")
         hint.pack(anchor="w", padx=4, pady=(0, 4))
 
@@ -314,11 +566,16 @@ class BpmCalculator(tk.Tk):
         self.scale.configure(command=self._on_bpm_scale)
 
     def _wire_events(self):
-        self.bpm_entry.bind("<KeyRelease>", lambda e: self.update_calculations())
-        self.bind("<Return>", lambda e: self.update_calculations())
+        self.bpm_entry.bind("<KeyRelease>", lambda e: self._on_bpm_entry_key())
+        self.bind("<Return>", lambda e: self._schedule_update())
         self.bind("<space>", lambda e: self.tap())
         self.swing_pct_var.trace_add("write", lambda *args: self._on_swing_change())
         self.audio_mode_var.trace_add("write", lambda *args: self._on_audio_mode_change())
+        self.bpm_var.trace_add("write", lambda *args: self._on_bpm_var_write())
+        for key, var in (("subdiv", self.metro_subdiv_var),
+                         ("accent_every", self.metro_accent_every_var),
+                         ("audio_on", self.audio_enabled_var), ("visual_on", self.visual_enabled_var)):
+            var.trace_add("write", lambda *args, k=key: self._refresh_tick_cache(k))
 
     def _on_audio_mode_change(self):
         self.stop_metronome()
@@ -326,9 +583,21 @@ class BpmCalculator(tk.Tk):
             self.audio_engine.cleanup()
         self.audio_engine = AudioEngine(mode=self.audio_mode_var.get())
 
-    def _on_bpm_scale(self, _):
-        self.bpm_var.set(round(self.scale.get(), 2))
-        self.update_calculations()
+    def _set_scale(self, value):
+        # ttk.Scale.set() runs the scale's -command; don't let that echo the
+        # value back into bpm_var and queue a second update.
+        self._syncing_scale = True
+        try:
+            self.scale.set(value)
+        finally:
+            self._syncing_scale = False
+
+    def _on_bpm_scale(self, value):
+        if self._syncing_scale:
+            return
+        # -command passes the new position; no need to ask the scale again
+        self.bpm_var.set(round(float(value), 2))
+        self._schedule_update()
 
     def _on_swing_change(self):
         try:
@@ -340,21 +609,39 @@ class BpmCalculator(tk.Tk):
         if value != self.swing_pct_var.get():
             self.swing_pct_var.set(value)
             return
+        self._schedule_update()
+
+    def _schedule_update(self):
+        # At most one recompute per UPDATE_DEBOUNCE_MS, using the latest values.
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(UPDATE_DEBOUNCE_MS, self._do_update)
+
+    def _do_update(self):
+        self._pending_update = None
         self.update_calculations()
 
+    def _on_bpm_entry_key(self):
+        # Checked once after the edit rather than by a validatecommand per keystroke
+        text = self.bpm_entry.get()
+        if not self._validate_bpm_entry(text):
+            # Drop the bad keystroke(s) like the old validatecommand did: restore
+            # the accepted text and pull the caret back over what was added.
+            good = self._last_good_text
+            caret = self.bpm_entry.index("insert") - (len(text) - len(good))
+            self.setvar(str(self.bpm_var), good)
+            self.bpm_entry.icursor(min(max(caret, 0), len(good)))
+            return
+        self._schedule_update()
+
     def _validate_bpm_entry(self, proposed: str):
-        if proposed == "":
-            return True
-        try:
-            float(proposed)
-            return True
-        except ValueError:
-            return False
+        # Digits with at most one decimal point; "" and "." are fine mid-edit
+        return BPM_TEXT_MATCH(proposed) is not None
 
     def set_bpm(self, value: float):
         self.bpm_var.set(float(value))
-        self.scale.set(float(value))
-        self.update_calculations()
+        self._set_scale(float(value))
+        self._schedule_update()
 
     # --- Tap tempo ---
     def tap(self):
@@ -404,23 +691,54 @@ class BpmCalculator(tk.Tk):
         if self.metro_thread and self.metro_thread.is_alive():
             return
         self.metro_stop.clear()
+        self._refresh_tick_cache()
+        if self.audio_engine.start_clock(self._tick_cache):
+            self._poll_clock_ticks()
+            return  # the audio callback keeps time
         self.metro_thread = threading.Thread(target=self._metronome_loop, daemon=True)
         self.metro_thread.start()
 
     def stop_metronome(self):
         self.metro_stop.set()
+        if self._clock_poll is not None:
+            self.after_cancel(self._clock_poll)
+            self._clock_poll = None
+        if self.audio_engine:
+            self.audio_engine.stop_clock()
+
+    def _poll_clock_ticks(self):
+        # Flash each tick queued by the audio clock when its click is heard
+        ticks = self.audio_engine.ticks
+        now = time.perf_counter()
+        while ticks:
+            accent, beat, heard = ticks.popleft()
+            self.after(max(0, int((heard - now) * 1000)), self._flash_visual, accent, beat)
+        self._clock_poll = self.after(CLOCK_POLL_MS, self._poll_clock_ticks)
+
+    def _on_bpm_var_write(self):
+        # Record only text the entry check accepts: Tcl's own parsing would also
+        # take "-5", "1e3" or "0x10" before <KeyRelease> gets to reject them.
+        text = str(self.getvar(str(self.bpm_var)))
+        if not self._validate_bpm_entry(text):
+            return
+        self._last_good_text = text
+        try:
+            self._last_good_bpm = float(text)
+        except ValueError:
+            return  # entry mid-edit ("" or "."); keep the last valid BPM
+        self._refresh_tick_cache("bpm")
+
+    def _refresh_tick_cache(self, key=None):
+        # A var mid-edit (e.g. an emptied spinbox) keeps its last good value.
+        for name, read in self._tick_readers.items():
+            if key is None or key == name:
+                try:
+                    self._tick_cache[name] = read()
+                except (tk.TclError, ValueError):
+                    pass
 
     def _subdiv_multiplier(self):
-        mode = self.metro_subdiv_var.get()
-        if mode == "Quarter":
-            return 1.0
-        if mode == "Eighth":
-            return 2.0
-        if mode == "Sixteenth":
-            return 4.0
-        if mode == "Quarter Triplets":
-            return 1.5
-        return 1.0
+        return SUBDIVISIONS.get(self.metro_subdiv_var.get(), 1.0)
 
     def _flash_visual(self, accent=False, count=0):
         # Accent bright (e.g., orange/red); normal dim (e.g., teal/blue)
@@ -433,27 +751,36 @@ class BpmCalculator(tk.Tk):
 
     def _metronome_loop(self):
         count = 0
-        next_time = time.perf_counter()
+        settings = self._tick_cache
+        # Ticks land on an absolute grid, anchor + n * period, so lateness never
+        # accumulates into tempo drift. The grid restarts when the tempo changes.
+        anchor = time.perf_counter()
+        n = 0
+        period = None
         while not self.metro_stop.is_set():
-            bpm = clamp_bpm(self.bpm_var.get())
+            bpm = settings["bpm"]
             if bpm <= 0:
-                time.sleep(0.05)
-                next_time = time.perf_counter() + 0.2
+                self.metro_stop.wait(0.05)
+                anchor, n, period = time.perf_counter(), 0, None
                 continue
 
-            subdiv = self._subdiv_multiplier()
+            subdiv = settings["subdiv"]
             beat_sec = 60.0 / bpm
-            period = beat_sec / subdiv
+            new_period = beat_sec / subdiv
+            if new_period != period:
+                if period is not None:
+                    anchor += n * period
+                n, period = 0, new_period
 
-            accent_every = max(1, int(self.metro_accent_every_var.get()))
+            accent_every = settings["accent_every"]
             is_accent = (count % accent_every == 0)
 
             # Schedule UI flash safely from thread
-            if self.visual_enabled_var.get():
+            if settings["visual_on"]:
                 self.after(0, self._flash_visual, is_accent, count % accent_every)
 
             # Play audio
-            if self.audio_enabled_var.get():
+            if settings["audio_on"]:
                 try:
                     self.audio_engine.play(accent=is_accent)
                 except Exception as e:
@@ -461,95 +788,91 @@ class BpmCalculator(tk.Tk):
 
             count = (count + 1) % 1000000
 
-            next_time += period
+            n += 1
+            next_time = anchor + n * period
             now = time.perf_counter()
-            delay = next_time - now
-            if delay < 0:
-                next_time = now
-                delay = 0
-            end = now + delay
-            while not self.metro_stop.is_set():
-                remaining = end - time.perf_counter()
-                if remaining <= 0:
-                    break
-                time.sleep(min(remaining, 0.01))
+            if now > next_time + period:
+                # More than a whole period late (e.g. a GC pause): skip the missed
+                # ticks instead of playing them in a burst, resuming at the first
+                # grid point after now.
+                missed = int((now - next_time) / period) + 1
+                n += missed
+                count = (count + missed) % 1000000
+                next_time = anchor + n * period
+            # Block once until just before the deadline (wakes immediately on stop),
+            # then spin the short tail for sub-ms precision.
+            if self.metro_stop.wait(timeout=max(0.0, next_time - METRO_SPIN_S - now)):
+                break
+            while time.perf_counter() < next_time:
+                pass
+
+    def _set_text(self, var, text):
+        # Skip the Tcl write (and label redraw) when the text is already shown
+        name = str(var)
+        if self._shown_text.get(name) != text:
+            self._shown_text[name] = text
+            var.set(text)
 
     def update_calculations(self):
-        bpm = clamp_bpm(self.bpm_var.get())
-        if bpm != self.bpm_var.get():
+        bpm = clamp_bpm(self._last_good_bpm)
+        if bpm != self._last_good_bpm:
             self.bpm_var.set(bpm)
-            self.scale.set(bpm)
+            self._set_scale(bpm)
 
-        ms_per_beat = (60000.0 / bpm) if bpm > 0 else float("inf")
-        hz = (bpm / 60.0)
+        try:
+            swing_pct = float(self.swing_pct_var.get())
+        except Exception:
+            swing_pct = 50.0
+        swing_pct = 50.0 if swing_pct < 50.0 else 80.0 if swing_pct > 80.0 else swing_pct
 
-        self.ms_per_beat_var.set("—" if ms_per_beat == float("inf") else f"{ms_per_beat:.2f} ms")
-        self.hz_var.set(f"{hz:.3f} Hz" if isfinite(hz) else "—")
+        # Nothing to redraw if the inputs match the last render
+        key = (bpm, swing_pct)
+        if key == self._last_update_key:
+            return
+        self._last_update_key = key
 
-        self.half_bpm_var.set(f"{bpm/2:.2f}")
-        self.double_bpm_var.set(f"{bpm*2:.2f}")
-        self.third_bpm_var.set(f"{bpm/3:.2f}")
-        self.quad_bpm_var.set(f"{bpm*4:.2f}")
+        if bpm <= 0:
+            self._show_zero_state()
+            return
+        self._zero_state_shown = False
 
-        if bpm > 0:
-            pair_ms = 60000.0 / bpm
-            try:
-                swing_pct = float(self.swing_pct_var.get())
-            except Exception:
-                swing_pct = 50.0
-            swing_pct = 50.0 if swing_pct < 50.0 else 80.0 if swing_pct > 80.0 else swing_pct
-            first_ms = pair_ms * (swing_pct / 100.0)
-            second_ms = pair_ms - first_ms
-            self.swing_first_ms_var.set(f"{first_ms:.2f} ms")
-            self.swing_second_ms_var.set(f"{second_ms:.2f} ms")
-        else:
-            self.swing_first_ms_var.set("—")
-            self.swing_second_ms_var.set("—")
+        ms_per_beat, hz, half, double, third, quad, *note_ms = bpm_table(bpm)
+
+        self._set_text(self.ms_per_beat_var, f"{ms_per_beat:.2f} ms")
+        self._set_text(self.hz_var, f"{hz:.3f} Hz")
+        self._set_text(self.related_bpm_var, RELATED_BPM_FORMAT.format(half, double, third, quad))
+
+        # A swung pair of 8ths spans one beat
+        first_ms = ms_per_beat * (swing_pct / 100.0)
+        second_ms = ms_per_beat - first_ms
+        self._set_text(self.swing_first_ms_var, f"{first_ms:.2f} ms")
+        self._set_text(self.swing_second_ms_var, f"{second_ms:.2f} ms")
 
         if hasattr(self, "tree"):
-            for row in self.tree.get_children():
-                self.tree.delete(row)
-
-            notes = [
-                ("1 bar (4/4)", 4.0),
-                ("Dotted half", 3.0),
-                ("Half", 2.0),
-                ("Dotted quarter", 1.5),
-                ("Quarter", 1.0),
-                ("Triplet quarter", 2.0/3.0),
-                ("Eighth", 0.5),
-                ("Triplet eighth", 1.0/3.0),
-                ("Sixteenth", 0.25),
-                ("Triplet sixteenth", 1.0/6.0),
-                ("Thirty-second", 0.125),
-                ("— Swung Eighths (pair) —", None),
-            ]
-
-            for name, beats in notes:
-                if beats is None:
-                    self.tree.insert("", "end", values=(name, "", ""))
-                    if bpm > 0:
-                        swing_pct = float(self.swing_pct_var.get())
-                        swing_pct = 50.0 if swing_pct < 50.0 else 80.0 if swing_pct > 80.0 else swing_pct
-                        pair_ms = 60000.0 / bpm
-                        first_ms = pair_ms * (swing_pct / 100.0)
-                        second_ms = pair_ms - first_ms
-                        self.tree.insert("", "end", values=(f"   First 8th ({swing_pct:.1f}%)", "—", f"{first_ms:.2f}"))
-                        self.tree.insert("", "end", values=(f"   Second 8th ({100.0 - swing_pct:.1f}%)", "—", f"{second_ms:.2f}"))
-                    else:
-                        self.tree.insert("", "end", values=("   First 8th", "—", "—"))
-                        self.tree.insert("", "end", values=("   Second 8th", "—", "—"))
-                    continue
-
-                if bpm <= 0:
-                    ms = "—"
-                else:
-                    ms = 60000.0 * beats / bpm
-                    ms = f"{ms:.2f}"
-                self.tree.insert("", "end", values=(name, f"{beats:g}", ms))
+            for iid, ms in zip(self._note_rows, note_ms):
+                self.tree.set(iid, "millis", f"{ms:.2f}")
+            self.tree.item(self._swing_first_row, values=(f"   First 8th ({swing_pct:.1f}%)", "—", f"{first_ms:.2f}"))
+            self.tree.item(self._swing_second_row, values=(f"   Second 8th ({100.0 - swing_pct:.1f}%)", "—", f"{second_ms:.2f}"))
+
+    def _show_zero_state(self):
+        # 0 BPM always renders the same fixed text; nothing to compute or format
+        self._set_text(self.ms_per_beat_var, "—")
+        self._set_text(self.hz_var, "0.000 Hz")
+        self._set_text(self.related_bpm_var, RELATED_BPM_ZERO)
+        self._set_text(self.swing_first_ms_var, "—")
+        self._set_text(self.swing_second_ms_var, "—")
+        if hasattr(self, "tree") and not self._zero_state_shown:
+            self._zero_state_shown = True
+            for iid in self._note_rows:
+                self.tree.set(iid, "millis", "—")
+            self.tree.item(self._swing_first_row, values=("   First 8th", "—", "—"))
+            self.tree.item(self._swing_second_row, values=("   Second 8th", "—", "—"))
 
     def destroy(self):
         self.stop_metronome()
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+            self._pending_update = None
         if self.audio_engine:
             self.audio_engine.cleanup()
         super().destroy()
@@ -558,12 +881,13 @@ if __name__ == "__main__":
     try:
         root = BpmCalculator()
         style = ttk.Style(root)
-        if "vista" in style.theme_names():
-            style.theme_use("vista")
-        elif "clam" in style.theme_names():
-            style.theme_use("clam")
+        themes = set(style.theme_names())
+        for theme in ("vista", "clam"):
+            if theme in themes:
+                style.theme_use(theme)
+                break
         root.mainloop()
     except Exception as e:
-        import sys, traceback
+        import traceback
         traceback.print_exc()
         sys.exit(1)